@@ -1,7 +1,8 @@
 from typing import (Iterable,
                     List,
                     Optional,
-                    Sequence)
+                    Sequence,
+                    cast)
 
 from ground.base import (Context,
                          Relation)
@@ -9,7 +10,8 @@ from ground.hints import (Point,
                           Segment)
 
 from .event import (Event,
-                    LeftEvent)
+                    LeftEvent,
+                    RightEvent)
 from .events_queue import EventsQueue
 from .sweep_line import SweepLine
 from .utils import classify_overlap
@@ -21,45 +23,53 @@ def sweep(segments: Sequence[Segment],
     events_queue = EventsQueue.from_segments(segments,
                                              context=context)
     sweep_line = SweepLine(context)
+    detect_intersection, pop_event = (events_queue.detect_intersection,
+                                      events_queue.pop)
+    add_event, find_equal_event, remove_event = (sweep_line.add,
+                                                 sweep_line.find_equal,
+                                                 sweep_line.remove)
+    to_above_event, to_below_event = sweep_line.above, sweep_line.below
     start: Optional[Point] = (events_queue.peek().start
                               if events_queue
                               else None)
     same_start_events: List[Event] = []
     while events_queue:
-        event = events_queue.pop()
-        if event.start == start:
+        event = pop_event()
+        event_start = event.start
+        # events of adjacent input segments share endpoints' objects
+        if event_start is start or event_start == start:
             same_start_events.append(event)
         else:
             yield from complete_events_relations(same_start_events)
-            same_start_events, start = [event], event.start
+            same_start_events.clear()
+            same_start_events.append(event)
+            start = event_start
         if event.is_left:
-            assert isinstance(event, LeftEvent), event
-            equal_segment_event = sweep_line.find_equal(event)
+            event = cast(LeftEvent, event)
+            equal_segment_event = find_equal_event(event)
             if equal_segment_event is None:
-                sweep_line.add(event)
-                below_event = sweep_line.below(event)
+                add_event(event)
+                below_event = to_below_event(event)
                 if below_event is not None:
-                    events_queue.detect_intersection(below_event, event,
-                                                     sweep_line)
-                above_event = sweep_line.above(event)
+                    detect_intersection(below_event, event, sweep_line)
+                above_event = to_above_event(event)
                 if above_event is not None:
-                    events_queue.detect_intersection(event, above_event,
-                                                     sweep_line)
+                    detect_intersection(event, above_event, sweep_line)
             else:
                 # found equal segments' fragments
                 equal_segment_event.merge_with(event)
         else:
-            event = event.left
-            equal_segment_event = sweep_line.find_equal(event)
+            event = cast(RightEvent, event).left
+            assert event.is_left, event
+            equal_segment_event = find_equal_event(event)
             if equal_segment_event is not None:
                 above_event, below_event = (
-                    sweep_line.above(equal_segment_event),
-                    sweep_line.below(equal_segment_event)
+                    to_above_event(equal_segment_event),
+                    to_below_event(equal_segment_event)
                 )
-                sweep_line.remove(equal_segment_event)
+                remove_event(equal_segment_event)
                 if below_event is not None and above_event is not None:
-                    events_queue.detect_intersection(below_event, above_event,
-                                                     sweep_line)
+                    detect_intersection(below_event, above_event, sweep_line)
                 if event is not equal_segment_event:
                     equal_segment_event.merge_with(event)
     yield from complete_events_relations(same_start_events)
@@ -68,29 +78,39 @@ def sweep(segments: Sequence[Segment],
 def complete_events_relations(
         same_start_events: Sequence[Event]
 ) -> Iterable[LeftEvent]:
-    for offset, first in enumerate(same_start_events,
-                                   start=1):
-        first_left = first if first.is_left else first.left
-        assert isinstance(first_left, LeftEvent), first_left
-        first_ids = first_left.segments_ids
+    left_events = [cast(LeftEvent, event)
+                   if event.is_left
+                   else cast(RightEvent, event).left
+                   for event in same_start_events]
+    assert all(left_event.is_left for left_event in left_events), left_events
+    segments_ids = [left_event.segments_ids for left_event in left_events]
+    # events of the group share the start,
+    # so it is an endpoint of the original segment for some of them only
+    are_starts_original = [event.start == event.original_start
+                           for event in same_start_events]
+    for offset, (first, first_left, first_ids,
+                 is_first_start_original) in enumerate(
+            zip(same_start_events, left_events, segments_ids,
+                are_starts_original),
+            start=1
+    ):
         for second_index in range(offset, len(same_start_events)):
             second = same_start_events[second_index]
-            second_left = second if second.is_left else second.left
-            assert isinstance(second_left, LeftEvent), second_left
-            second_ids = second_left.segments_ids
-            first_extra_ids_count, second_extra_ids_count = (
-                len(first_ids - second_ids), len(second_ids - first_ids)
+            second_left, second_ids = (left_events[second_index],
+                                       segments_ids[second_index])
+            has_first_extra_ids, has_second_extra_ids = (
+                not first_ids <= second_ids, not second_ids <= first_ids
             )
-            if first_extra_ids_count and second_extra_ids_count:
+            if has_first_extra_ids and has_second_extra_ids:
                 relation = (Relation.TOUCH
-                            if (first.start == first.original_start
-                                or second.start == second.original_start)
+                            if (is_first_start_original
+                                or are_starts_original[second_index])
                             else Relation.CROSS)
                 first.register_tangent(second)
                 second.register_tangent(first)
                 first_left.register_relation(relation)
                 second_left.register_relation(relation.complement)
-            elif first_extra_ids_count or second_extra_ids_count:
+            elif has_first_extra_ids or has_second_extra_ids:
                 relation = classify_overlap(first_left.original_start,
                                             first_left.original_end,
                                             second_left.original_start,
@@ -1,148 +1,102 @@
 from __future__ import annotations
 
-from abc import (ABC,
-                 abstractmethod)
-from reprlib import recursive_repr
 from typing import (ClassVar,
                     Dict,
                     List,
                     Optional,
                     Sequence,
                     Set,
-                    Tuple)
+                    Tuple,
+                    Union)
 
 from ground.base import Relation
 from ground.hints import (Point,
                           Segment)
 from reprit.base import generate_repr
 
-from .utils import (classify_overlap,
-                    to_sorted_pair)
+from .utils import classify_overlap
 
 
-class Event(ABC):
-    __slots__ = ()
-
+class BaseEvent:
     is_left: ClassVar[bool]
-    left: LeftEvent
-    right: RightEvent
+    original_start: Point
+    start: Point
 
     @property
-    @abstractmethod
-    def end(self) -> Point:
-        """Returns end of the event."""
-
-    @property
-    @abstractmethod
-    def original_end(self) -> Point:
-        """Returns original end of the event."""
-
-    @property
-    @abstractmethod
-    def original_start(self) -> Point:
-        """Returns original start of the segment."""
-
-    @abstractmethod
-    def register_tangent(self, tangent: 'Event') -> None:
-        """Registers new tangent to the event"""
+    def tangents(self) -> Sequence[Event]:
+        return self._tangents or ()
 
-    @property
-    @abstractmethod
-    def segments_ids(self) -> Set[int]:
-        """Returns segments ids of the event."""
+    # most of events have no tangents, so the list is created lazily
+    _tangents: Optional[List[Event]]
 
-    @property
-    @abstractmethod
-    def start(self) -> Point:
-        """Returns start of the event."""
+    __slots__ = 'original_start', 'start', '_tangents'
 
-    @property
-    @abstractmethod
-    def tangents(self) -> Sequence['Event']:
-        """Returns tangents of the event."""
+    def register_tangent(self, tangent: Event) -> None:
+        assert self.start == tangent.start
+        tangents = self._tangents
+        if tangents is None:
+            self._tangents = [tangent]
+        else:
+            tangents.append(tangent)
 
 
-class LeftEvent(Event):
+class LeftEvent(BaseEvent):
     @classmethod
     def from_segment(cls, segment: Segment, segment_id: int) -> LeftEvent:
-        start, end = to_sorted_pair(segment.start, segment.end)
-        result = LeftEvent(start, None, start, {start: {end: {segment_id}}})
-        result._right = RightEvent(end, result, end)
+        start, end = segment.start, segment.end
+        if end < start:
+            start, end = end, start
+        right = RightEvent(end, end)
+        result = right.left = LeftEvent(start, end, right, start, end,
+                                        {(start, end): {segment_id}})
         return result
 
     is_left = True
 
-    @property
-    def end(self) -> Point:
-        return self.right.start
-
-    @property
-    def original_start(self) -> Point:
-        return self._original_start
-
-    @property
-    def original_end(self) -> Point:
-        return self.right.original_start
-
     @property
     def segments_ids(self) -> Set[int]:
-        return self.parts_ids[self.start][self.end]
-
-    @property
-    def right(self) -> RightEvent:
-        result = self._right
-        assert result is not None, self
-        return result
-
-    @right.setter
-    def right(self, value: RightEvent) -> None:
-        self._right = value
-
-    @property
-    def start(self) -> Point:
-        return self._start
-
-    @property
-    def tangents(self) -> Sequence[Event]:
-        return self._tangents
+        return self.parts_ids[(self.start, self.end)]
 
-    _right: Optional[RightEvent]
-
-    __slots__ = ('parts_ids', '_original_start', '_relations_mask', '_right',
-                 '_start', '_tangents')
+    __slots__ = ('end', 'original_end', 'parts_ids', 'right',
+                 '_relations_mask')
 
     def __init__(self,
                  start: Point,
-                 right: Optional[RightEvent],
+                 end: Point,
+                 right: RightEvent,
                  original_start: Point,
-                 parts_ids: Dict[Point, Dict[Point, Set[int]]]) -> None:
-        self._right, self.parts_ids, self._original_start, self._start = (
-            right, parts_ids, original_start, start
-        )
+                 original_end: Point,
+                 parts_ids: Dict[Tuple[Point, Point], Set[int]]) -> None:
+        (
+            self.end, self.right, self.original_end, self.original_start,
+            self.parts_ids, self.start
+        ) = end, right, original_end, original_start, parts_ids, start
         self._relations_mask = 0
-        self._tangents = []  # type: List[Event]
+        self._tangents = None
 
-    __repr__ = recursive_repr()(generate_repr(__init__))
+    __repr__ = generate_repr(__init__)
 
     def divide(self, point: Point) -> Tuple[RightEvent, LeftEvent]:
         """Divides the event at given break point and returns tail."""
-        segments_ids = self.segments_ids
-        (self.parts_ids.setdefault(self.start, {})
-         .setdefault(point, set()).update(segments_ids))
-        (self.parts_ids.setdefault(point, {})
-         .setdefault(self.end, set()).update(segments_ids))
+        parts_ids, segments_ids = self.parts_ids, self.segments_ids
+        for part in (self.start, point), (point, self.end):
+            part_ids = parts_ids.get(part)
+            if part_ids is None:
+                parts_ids[part] = set(segments_ids)
+            else:
+                part_ids.update(segments_ids)
         point_to_end_event = self.right.left = LeftEvent(
-                point, self.right, self.original_start, self.parts_ids
+                point, self.end, self.right, self.original_start,
+                self.original_end, parts_ids
         )
-        point_to_start_event = self._right = RightEvent(point, self,
-                                                        self.original_end)
+        self.end = point
+        point_to_start_event = self.right = RightEvent(point,
+                                                       self.original_end)
+        point_to_start_event.left = self
         return point_to_start_event, point_to_end_event
 
-    def has_only_relations(self, *relations: Relation) -> bool:
-        mask = self._relations_mask
-        for relation in relations:
-            mask &= ~(1 << relation)
-        return not mask
+    def has_only_relations(self, relations_mask: int) -> bool:
+        return not self._relations_mask & ~relations_mask
 
     def merge_with(self, other: LeftEvent) -> None:
         assert self.start == other.start and self.end == other.end
@@ -152,70 +106,47 @@ class LeftEvent(Event):
         )
         self.register_relation(full_relation)
         other.register_relation(full_relation.complement)
-        start, end = self.start, self.end
-        self.parts_ids[start][end] = other.parts_ids[start][end] = (
-                self.parts_ids[start][end] | other.parts_ids[start][end]
+        key = self.start, self.end
+        self.parts_ids[key] = other.parts_ids[key] = (
+                self.parts_ids[key] | other.parts_ids[key]
         )
 
-    def register_tangent(self, tangent: Event) -> None:
-        assert self.start == tangent.start
-        self._tangents.append(tangent)
-
     def register_relation(self, relation: Relation) -> None:
         self._relations_mask |= 1 << relation
 
 
-class RightEvent(Event):
+class RightEvent(BaseEvent):
     is_left = False
 
     @property
     def end(self) -> Point:
         return self.left.start
 
-    @property
-    def left(self) -> LeftEvent:
-        result = self._left
-        assert result is not None, self
-        return result
-
-    @left.setter
-    def left(self, value: LeftEvent) -> None:
-        self._left = value
-
     @property
     def original_end(self) -> Point:
         return self.left.original_start
 
-    @property
-    def original_start(self) -> Point:
-        return self._original_start
-
     @property
     def segments_ids(self) -> Set[int]:
         return self.left.segments_ids
 
-    @property
-    def start(self) -> Point:
-        return self._start
+    # left event is linked right after creation
+    left: LeftEvent
 
-    @property
-    def tangents(self) -> Sequence[Event]:
-        return self._tangents
+    __slots__ = 'left',
 
-    _left: Optional[LeftEvent]
+    def __init__(self, start: Point, original_start: Point) -> None:
+        self.original_start, self.start = original_start, start
+        self._tangents = None
 
-    __slots__ = '_left', '_original_start', '_start', '_tangents'
+    __repr__ = generate_repr(__init__)
 
-    def __init__(self,
-                 start: Point,
-                 left: Optional[LeftEvent],
-                 original_start: Point) -> None:
-        self._left, self._original_start, self._start = (left, original_start,
-                                                         start)
-        self._tangents = []  # type: List[Event]
 
-    __repr__ = recursive_repr()(generate_repr(__init__))
+Event = Union[LeftEvent, RightEvent]
 
-    def register_tangent(self, tangent: 'Event') -> None:
-        assert self.start == tangent.start
-        self._tangents.append(tangent)
+
+def to_relations_mask(*relations: Relation) -> int:
+    result = 0
+    for relation in relations:
+        result |= 1 << relation
+    return result
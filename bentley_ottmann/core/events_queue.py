@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from typing import (Any,
-                    Sequence)
+from heapq import (heappop,
+                   heappush)
+from itertools import count
+from typing import (List,
+                    Sequence,
+                    Tuple)
 
 from ground.base import (Context,
                          Relation)
-from ground.hints import Segment
-from prioq.base import PriorityQueue
+from ground.hints import (Point,
+                          Scalar,
+                          Segment)
 from reprit.base import generate_repr
 
 from .event import (Event,
-                    LeftEvent)
+                    LeftEvent,
+                    RightEvent)
 from .sweep_line import SweepLine
+from .utils import boxes_overlap
 
 
 class EventsQueue:
@@ -21,87 +28,103 @@ class EventsQueue:
                       *,
                       context: Context) -> 'EventsQueue':
         result = cls(context)
+        endpoints = result._endpoints
         for index, segment in enumerate(segments):
             event = LeftEvent.from_segment(segment, index)
-            result.push(event)
-            result.push(event.right)
+            endpoints.append(result._to_entry(event))
+            endpoints.append(result._to_entry(event.right))
+        # sorted in descending order to be popped from the end
+        endpoints.sort(reverse=True)
         return result
 
-    __slots__ = 'context', '_queue'
+    __slots__ = ('context', '_counter', '_endpoints', '_queue',
+                 '_segments_intersection', '_segments_relation')
 
     def __init__(self, context: Context) -> None:
         self.context = context
-        self._queue: PriorityQueue[EventsQueueKey, Event] = PriorityQueue(
-                key=EventsQueueKey
+        self._segments_intersection, self._segments_relation = (
+            context.segments_intersection, context.segments_relation
         )
+        # counter breaks ties between equal keys,
+        # so events themselves are never compared
+        self._counter = count()
+        # endpoints of input segments are known beforehand,
+        # so they are kept sorted and only events
+        # produced during the sweep go through the heap
+        self._endpoints: List[Tuple[EventsQueueKey, int, Event]] = []
+        self._queue: List[Tuple[EventsQueueKey, int, Event]] = []
 
     __repr__ = generate_repr(__init__)
 
     def __bool__(self) -> bool:
-        return bool(self._queue)
+        return bool(self._endpoints or self._queue)
 
     def detect_intersection(self,
                             below_event: LeftEvent,
                             event: LeftEvent,
                             sweep_line: SweepLine) -> None:
-        relation = self.context.segments_relation(below_event, event)
+        below_start, below_end = below_event.start, below_event.end
+        start, end = event.start, event.end
+        if not boxes_overlap(below_start, below_end, start, end):
+            # bounding boxes are disjoint, so are the segments
+            return
+        relation = self._segments_relation(below_event, event)
         if relation is Relation.DISJOINT:
             return
         elif relation is Relation.TOUCH or relation is Relation.CROSS:
             # segments touch or cross
-            point = self.context.segments_intersection(below_event, event)
+            point = self._segments_intersection(below_event, event)
             assert event.segments_ids.isdisjoint(below_event.segments_ids)
-            if point != below_event.start and point != below_event.end:
-                below_below_event = sweep_line.below(below_event)
-                assert not (below_below_event is not None
-                            and below_below_event.start == below_event.start
-                            and below_below_event.end == point)
+            if point != below_start and point != below_end:
+                if __debug__:
+                    below_below_event = sweep_line.below(below_event)
+                    assert not (below_below_event is not None
+                                and below_below_event.start == below_start
+                                and below_below_event.end == point)
                 (
                     point_to_below_event_start_event,
                     point_to_below_event_end_event
-                ) = below_event.divide(point)
+                ) = self._divide(below_event, point)
                 self.push(point_to_below_event_start_event)
                 self.push(point_to_below_event_end_event)
-            if point != event.start and point != event.end:
+            if point != start and point != end:
                 above_event = sweep_line.above(event)
                 if (above_event is not None
-                        and above_event.start == event.start
+                        and above_event.start == start
                         and above_event.end == point):
                     sweep_line.remove(above_event)
                     (
                         point_to_event_start_event, point_to_event_end_event
-                    ) = event.divide(point)
+                    ) = self._divide(event, point)
                     self.push(point_to_event_start_event)
                     self.push(point_to_event_end_event)
                     event.merge_with(above_event)
                 else:
                     (
                         point_to_event_start_event, point_to_event_end_event
-                    ) = event.divide(point)
+                    ) = self._divide(event, point)
                     self.push(point_to_event_start_event)
                     self.push(point_to_event_end_event)
         else:
             # segments overlap
-            starts_equal = event.start == below_event.start
+            starts_equal = start == below_start
             min_start_event, max_start_event = (
                 (event, below_event)
-                if (starts_equal
-                    or EventsQueueKey(event) < EventsQueueKey(below_event))
+                if starts_equal or start < below_start
                 else (below_event, event)
             )
-            ends_equal = event.end == below_event.end
+            ends_equal = end == below_end
             min_end_event, max_end_event = (
                 (event.right, below_event.right)
-                if ends_equal or (EventsQueueKey(event.right)
-                                  < EventsQueueKey(below_event.right))
+                if ends_equal or end < below_end
                 else (below_event.right, event.right)
             )
             if starts_equal:
                 assert not ends_equal
                 # segments share the left endpoint
                 sweep_line.remove(max_end_event.left)
-                _, min_end_to_max_end_event = max_end_event.left.divide(
-                        min_end_event.start
+                _, min_end_to_max_end_event = self._divide(
+                        max_end_event.left, min_end_event.start
                 )
                 self.push(min_end_to_max_end_event)
                 event.merge_with(below_event)
@@ -109,79 +132,96 @@ class EventsQueue:
                 # segments share the right endpoint
                 (
                     max_start_to_min_start, max_start_to_end_event
-                ) = min_start_event.divide(max_start_event.start)
+                ) = self._divide(min_start_event, max_start_event.start)
                 max_start_event.merge_with(max_start_to_end_event)
                 self.push(max_start_to_min_start)
             elif min_start_event is max_end_event.left:
                 # one line segment includes the other one
                 (
                     min_end_to_min_start_event, min_end_to_max_end_event
-                ) = min_start_event.divide(min_end_event.start)
+                ) = self._divide(min_start_event, min_end_event.start)
                 self.push(min_end_to_min_start_event)
                 self.push(min_end_to_max_end_event)
                 (
                     max_start_to_min_start_event, max_start_to_min_end_event
-                ) = min_start_event.divide(max_start_event.start)
+                ) = self._divide(min_start_event, max_start_event.start)
                 max_start_event.merge_with(max_start_to_min_end_event)
                 self.push(max_start_to_min_start_event)
             else:
                 # no line segment includes the other one
                 (
                     min_end_to_max_start_event, min_end_to_max_end_event
-                ) = max_start_event.divide(min_end_event.start)
+                ) = self._divide(max_start_event, min_end_event.start)
                 self.push(min_end_to_max_start_event)
                 self.push(min_end_to_max_end_event)
                 (
                     max_start_to_min_start_event, max_start_to_min_end_event
-                ) = min_start_event.divide(max_start_event.start)
+                ) = self._divide(min_start_event, max_start_event.start)
                 max_start_event.merge_with(max_start_to_min_end_event)
                 self.push(max_start_to_min_start_event)
 
     def peek(self) -> Event:
-        return self._queue.peek()
+        self._drop_outdated_head()
+        return (self._queue[0]
+                if self._is_queue_head_first()
+                else self._endpoints[-1])[2]
 
     def pop(self) -> Event:
-        return self._queue.pop()
+        self._drop_outdated_head()
+        return (heappop(self._queue)
+                if self._is_queue_head_first()
+                else self._endpoints.pop())[2]
 
     def push(self, event: Event) -> None:
+        heappush(self._queue, self._to_entry(event))
+
+    def _divide(self,
+                event: LeftEvent,
+                point: Point) -> Tuple[RightEvent, LeftEvent]:
+        point_to_start_event, point_to_end_event = event.divide(point)
+        # right event gets relinked to the tail and its end changes,
+        # so it is pushed with the new key
+        # and the entry with the former one becomes outdated
+        self.push(point_to_end_event.right)
+        return point_to_start_event, point_to_end_event
+
+    def _drop_outdated_head(self) -> None:
+        # ends of right events only move forward on division,
+        # so outdated entries always precede the actual ones
+        while True:
+            is_queue_head_first = self._is_queue_head_first()
+            key, _, event = (self._queue[0]
+                             if is_queue_head_first
+                             else self._endpoints[-1])
+            if event.is_left or key == to_events_queue_key(event):
+                return
+            elif is_queue_head_first:
+                heappop(self._queue)
+            else:
+                self._endpoints.pop()
+
+    def _is_queue_head_first(self) -> bool:
+        endpoints, queue = self._endpoints, self._queue
+        return bool(queue) and (not endpoints or queue[0] < endpoints[-1])
+
+    def _to_entry(self, event: Event) -> Tuple[EventsQueueKey, int, Event]:
         if event.start == event.end:
             raise ValueError('Degenerate segment found '
                              'with both endpoints being: {}.'
                              .format(event.start))
-        self._queue.push(event)
+        return to_events_queue_key(event), next(self._counter), event
 
 
-class EventsQueueKey:
-    event: Event
+EventsQueueKey = Tuple[Scalar, Scalar, bool, Scalar, Scalar]
 
-    __slots__ = 'event',
 
-    def __init__(self, event: Event) -> None:
-        self.event = event
-
-    __repr__ = generate_repr(__init__)
-
-    def __lt__(self, other: EventsQueueKey) -> Any:
-        """
-        Checks if the event should be processed before the other.
-        """
-        event, other_event = self.event, other.event
-        start_x, start_y = event.start.x, event.start.y
-        other_start_x, other_start_y = other_event.start.x, other_event.start.y
-        if start_x != other_start_x:
-            # different x-coordinate,
-            # the event with lower x-coordinate is processed first
-            return start_x < other_start_x
-        elif start_y != other_start_y:
-            # different starts, but same x-coordinate,
-            # the event with lower y-coordinate is processed first
-            return start_y < other_start_y
-        elif event.is_left is not other_event.is_left:
-            # same start, but one is a left endpoint
-            # and the other is a right endpoint,
-            # the right endpoint is processed first
-            return not event.is_left
-        else:
-            # same start,
-            # both events are left endpoints or both are right endpoints
-            return event.end < other_event.end
+def to_events_queue_key(event: Event) -> EventsQueueKey:
+    """
+    Returns key of the event in the queue,
+    events with lower keys should be processed first.
+    """
+    start, end = event.start, event.end
+    # the event with lower start is processed first,
+    # for the same start the right endpoint is processed first,
+    # otherwise the event with lower end is processed first
+    return start.x, start.y, event.is_left, end.x, end.y
@@ -3,10 +3,10 @@ from __future__ import annotations
 from functools import partial
 from typing import (Any,
                     Callable,
+                    Dict,
                     Optional)
 
 from dendroid import red_black
-from dendroid.hints import KeyedSet
 from ground.base import (Context,
                          Orientation)
 from ground.hints import Point
@@ -16,44 +16,56 @@ from .event import LeftEvent
 
 
 class SweepLine:
-    __slots__ = 'context', '_set'
+    __slots__ = 'context', '_key', '_nodes', '_tree'
 
     def __init__(self, context: Context) -> None:
         self.context = context
-        self._set: KeyedSet[SweepLineKey, LeftEvent] = red_black.set_(
-                key=partial(SweepLineKey, context.angle_orientation)
+        self._key: Callable[[LeftEvent], SweepLineKey] = partial(
+                SweepLineKey, context.angle_orientation
+        )
+        self._nodes: Dict[LeftEvent, red_black.Node[SweepLineKey,
+                                                     LeftEvent]] = {}
+        self._tree: red_black.Tree[SweepLineKey, LeftEvent] = (
+            red_black.Tree(red_black.NIL)
         )
 
     __repr__ = generate_repr(__init__)
 
     def add(self, event: LeftEvent) -> None:
-        self._set.add(event)
+        self._nodes[event] = self._tree.insert(self._key(event), event)
 
     def find_equal(self, event: LeftEvent) -> Optional[LeftEvent]:
-        try:
-            candidate = self._set.floor(event)
-        except ValueError:
+        node = self._tree.infimum(self._key(event))
+        if node is red_black.NIL:
             return None
-        else:
-            return (candidate
-                    if (candidate.start == event.start
-                        and candidate.end == event.end)
-                    else None)
+        candidate = node.value
+        return (candidate
+                if (candidate.start == event.start
+                    and candidate.end == event.end)
+                else None)
 
     def remove(self, event: LeftEvent) -> None:
-        self._set.remove(event)
+        self._tree.remove(self._nodes.pop(event))
 
     def above(self, event: LeftEvent) -> Optional[LeftEvent]:
-        try:
-            return self._set.next(event)
-        except ValueError:
+        node = self._nodes.get(event)
+        if node is None:
             return None
+        node = self._tree.successor(node)
+        # at the ends of the tree root's parent is returned,
+        # which is ``None`` rather than ``NIL`` in general
+        return (None
+                if node is None or node is red_black.NIL
+                else node.value)
 
     def below(self, event: LeftEvent) -> Optional[LeftEvent]:
-        try:
-            return self._set.prev(event)
-        except ValueError:
+        node = self._nodes.get(event)
+        if node is None:
             return None
+        node = self._tree.predecessor(node)
+        return (None
+                if node is None or node is red_black.NIL
+                else node.value)
 
 
 class SweepLineKey:
@@ -74,10 +86,13 @@ class SweepLineKey:
         event, other_event = self.event, other.event
         if event is other_event:
             return False
+        orienteer = self.orienteer
         start, other_start = event.start, other_event.start
         end, other_end = event.end, other_event.end
-        other_start_orientation = self.orienteer(start, end, other_start)
-        other_end_orientation = self.orienteer(start, end, other_end)
+        other_start_orientation = (Orientation.COLLINEAR
+                                   if other_start is start
+                                   else orienteer(start, end, other_start))
+        other_end_orientation = orienteer(start, end, other_end)
         if other_start_orientation is other_end_orientation:
             start_x, start_y = start.x, start.y
             other_start_x, other_start_y = other_start.x, other_start.y
@@ -98,8 +113,11 @@ class SweepLineKey:
                     return end_x < other_end_x
             else:
                 return start_y < other_start_y
-        start_orientation = self.orienteer(other_start, other_end, start)
-        end_orientation = self.orienteer(other_start, other_end, end)
+        elif other_start is start:
+            # segments share the start, but are not collinear
+            return other_end_orientation is Orientation.COUNTERCLOCKWISE
+        start_orientation = orienteer(other_start, other_end, start)
+        end_orientation = orienteer(other_start, other_end, end)
         if start_orientation is end_orientation:
             return start_orientation is Orientation.CLOCKWISE
         elif other_start_orientation is Orientation.COLLINEAR:
@@ -1,6 +1,5 @@
 import typing as t
 
-import typing_extensions as te
 from ground.base import Relation
 from ground.hints import Point
 
@@ -19,6 +18,25 @@ def all_unique(values: t.Iterable[_HashableT]) -> bool:
     return True
 
 
+def boxes_overlap(first_start: Point,
+                  first_end: Point,
+                  second_start: Point,
+                  second_end: Point) -> bool:
+    assert first_start < first_end
+    assert second_start < second_end
+    if first_end.x < second_start.x or second_end.x < first_start.x:
+        return False
+    first_start_y, first_end_y = first_start.y, first_end.y
+    first_min_y, first_max_y = ((first_start_y, first_end_y)
+                                if first_start_y < first_end_y
+                                else (first_end_y, first_start_y))
+    second_start_y, second_end_y = second_start.y, second_end.y
+    second_min_y, second_max_y = ((second_start_y, second_end_y)
+                                  if second_start_y < second_end_y
+                                  else (second_end_y, second_start_y))
+    return not (first_max_y < second_min_y or second_max_y < first_min_y)
+
+
 def classify_overlap(test_start: Point,
                      test_end: Point,
                      goal_start: Point,
@@ -44,18 +62,3 @@ def classify_overlap(test_start: Point,
         return (Relation.COMPOSITE
                 if goal_end < test_end
                 else Relation.OVERLAP)
-
-
-class _Comparable(te.Protocol):
-    def __lt__(self, other: te.Self) -> bool:
-        ...
-
-
-_ComparableT = t.TypeVar('_ComparableT',
-                         bound=_Comparable)
-
-
-def to_sorted_pair(
-        start: _ComparableT, end: _ComparableT
-) -> t.Tuple[_ComparableT, _ComparableT]:
-    return (start, end) if start < end else (end, start)
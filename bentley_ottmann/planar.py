@@ -7,8 +7,13 @@ from ground.hints import (Contour as _Contour,
                           Segment as _Segment)
 
 from .core.base import sweep as _sweep
+from .core.event import to_relations_mask as _to_relations_mask
 from .core.utils import all_unique as _all_unique
 
+_DISJOINT_MASK = _to_relations_mask(_Relation.DISJOINT)
+_DISJOINT_OR_TOUCH_MASK = _to_relations_mask(_Relation.DISJOINT,
+                                             _Relation.TOUCH)
+
 
 def contour_self_intersects(contour: _Contour,
                             *,
@@ -59,8 +64,7 @@ def contour_self_intersects(contour: _Contour,
     if context is None:
         context = _get_context()
     segments = context.contour_segments(contour)
-    return not all(event.has_only_relations(_Relation.DISJOINT,
-                                            _Relation.TOUCH)
+    return not all(event.has_only_relations(_DISJOINT_OR_TOUCH_MASK)
                    and len(event.tangents) == 1
                    for event in _sweep(segments,
                                        context=context))
@@ -102,7 +106,7 @@ def segments_intersect(segments: _t.Sequence[_Segment],
     ...                     Segment(Point(2, 0), Point(0, 2))])
     True
     """
-    return not all(event.has_only_relations(_Relation.DISJOINT)
+    return not all(event.has_only_relations(_DISJOINT_MASK)
                    for event in _sweep(segments,
                                        context=(_get_context()
                                                 if context is None
@@ -145,8 +149,7 @@ def segments_cross_or_overlap(segments: _t.Sequence[_Segment],
     ...                            Segment(Point(0, 2), Point(2, 0))])
     True
     """
-    return not all(event.has_only_relations(_Relation.DISJOINT,
-                                            _Relation.TOUCH)
+    return not all(event.has_only_relations(_DISJOINT_OR_TOUCH_MASK)
                    for event in _sweep(segments,
                                        context=(_get_context()
                                                 if context is None
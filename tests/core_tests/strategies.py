@@ -0,0 +1,13 @@
+from functools import partial
+
+from ground.base import Relation
+from hypothesis import strategies
+
+from tests.strategies import segments_strategies
+from tests.utils import to_pairs
+
+segments_lists = segments_strategies.flatmap(partial(strategies.lists,
+                                                     max_size=10))
+segments_pairs = segments_strategies.flatmap(to_pairs)
+relations_sets = strategies.frozensets(strategies.sampled_from(Relation))
+relations_sets_pairs = to_pairs(relations_sets)
@@ -0,0 +1,25 @@
+from ground.base import (Context,
+                         Relation)
+
+from bentley_ottmann.core.base import sweep
+from bentley_ottmann.core.event import to_relations_mask
+from tests.utils import (Point,
+                         Segment)
+
+
+def test_divided_segment_right_event(context: Context) -> None:
+    start, end = Point(2, 1), Point(2, 2)
+    segments = [Segment(start, end), Segment(Point(1, 0), end),
+                Segment(Point(2, 0), end), Segment(start, end),
+                Segment(Point(2, 0), end)]
+
+    result = [event
+              for event in sweep(segments,
+                                 context=context)
+              if event.start == start and event.end == end]
+
+    mask = to_relations_mask(Relation.TOUCH, Relation.EQUAL,
+                             Relation.COMPONENT)
+    assert sorted(event.has_only_relations(mask) for event in result) == [
+        False, False, True
+    ]
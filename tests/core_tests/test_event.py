@@ -0,0 +1,42 @@
+from typing import (FrozenSet,
+                    Tuple)
+
+from ground.base import Relation
+from hypothesis import given
+
+from bentley_ottmann.core.event import (LeftEvent,
+                                        to_relations_mask)
+from tests.utils import (Point,
+                         Segment)
+from . import strategies
+
+
+@given(strategies.relations_sets_pairs)
+def test_has_only_relations(
+        relations_sets_pair: Tuple[FrozenSet[Relation], FrozenSet[Relation]]
+) -> None:
+    registered, wanted = relations_sets_pair
+    event = LeftEvent.from_segment(Segment(Point(0, 0), Point(1, 1)), 0)
+    for relation in registered:
+        event.register_relation(relation)
+
+    result = event.has_only_relations(to_relations_mask(*wanted))
+
+    assert result is (registered <= wanted)
+
+
+def test_divide() -> None:
+    event = LeftEvent.from_segment(Segment(Point(2, 2), Point(0, 0)), 0)
+
+    point_to_start_event, point_to_end_event = event.divide(Point(1, 1))
+
+    assert event.end == point_to_start_event.start == Point(1, 1)
+    assert event.right is point_to_start_event
+    assert point_to_start_event.left is event
+    assert point_to_end_event.start == Point(1, 1)
+    assert point_to_end_event.end == Point(2, 2)
+    assert point_to_end_event.right.left is point_to_end_event
+    assert (event.original_start, event.original_end) == (
+        point_to_end_event.original_start, point_to_end_event.original_end
+    ) == (Point(0, 0), Point(2, 2))
+    assert event.segments_ids == point_to_end_event.segments_ids == {0}
@@ -0,0 +1,51 @@
+from typing import List
+
+from ground.base import Context
+from hypothesis import given
+
+from bentley_ottmann.core.events_queue import (EventsQueue,
+                                               to_events_queue_key)
+from bentley_ottmann.core.sweep_line import SweepLine
+from tests.utils import (Point,
+                         Segment)
+from . import strategies
+
+
+@given(strategies.segments_lists)
+def test_endpoints_order(context: Context, segments: List[Segment]) -> None:
+    events_queue = EventsQueue.from_segments(segments,
+                                             context=context)
+
+    keys = []
+    while events_queue:
+        event = events_queue.peek()
+        assert events_queue.pop() is event
+        keys.append(to_events_queue_key(event))
+
+    assert len(keys) == 2 * len(segments)
+    assert keys == sorted(keys)
+
+
+def test_divided_events_before_endpoint(context: Context) -> None:
+    events_queue = EventsQueue.from_segments(
+            [Segment(Point(0, 0), Point(4, 4)),
+             Segment(Point(0, 4), Point(4, 0)),
+             Segment(Point(3, 0), Point(5, 0))],
+            context=context
+    )
+    sweep_line = SweepLine(context)
+    below_event, event = events_queue.pop(), events_queue.pop()
+    sweep_line.add(below_event)
+    sweep_line.add(event)
+
+    events_queue.detect_intersection(below_event, event, sweep_line)
+
+    events = []
+    while events_queue:
+        events.append(events_queue.pop())
+    assert [(event.start, event.end, event.is_left) for event in events] == [
+        (Point(2, 2), Point(0, 0), False), (Point(2, 2), Point(0, 4), False),
+        (Point(2, 2), Point(4, 0), True), (Point(2, 2), Point(4, 4), True),
+        (Point(3, 0), Point(5, 0), True), (Point(4, 0), Point(2, 2), False),
+        (Point(4, 4), Point(2, 2), False), (Point(5, 0), Point(3, 0), False)
+    ]
@@ -0,0 +1,66 @@
+from ground.base import Context
+
+from bentley_ottmann.core.event import LeftEvent
+from bentley_ottmann.core.sweep_line import SweepLine
+from tests.utils import (Point,
+                         Segment)
+
+
+def test_neighbours(context: Context) -> None:
+    sweep_line = SweepLine(context)
+    bottom, middle, top = events = [
+        LeftEvent.from_segment(Segment(Point(0, y), Point(1, y)), index)
+        for index, y in enumerate(range(3))
+    ]
+    for event in events:
+        sweep_line.add(event)
+
+    assert sweep_line.below(bottom) is None
+    assert sweep_line.above(bottom) is middle
+    assert sweep_line.below(middle) is bottom
+    assert sweep_line.above(middle) is top
+    assert sweep_line.below(top) is middle
+    assert sweep_line.above(top) is None
+
+
+def test_neighbours_after_removal(context: Context) -> None:
+    sweep_line = SweepLine(context)
+    bottom, middle, top = events = [
+        LeftEvent.from_segment(Segment(Point(0, y), Point(1, y)), index)
+        for index, y in enumerate(range(3))
+    ]
+    for event in events:
+        sweep_line.add(event)
+
+    sweep_line.remove(middle)
+
+    assert sweep_line.above(middle) is sweep_line.below(middle) is None
+    assert sweep_line.above(bottom) is top
+    assert sweep_line.below(top) is bottom
+
+    sweep_line.remove(top)
+
+    assert sweep_line.above(bottom) is sweep_line.below(bottom) is None
+
+    sweep_line.add(top)
+    sweep_line.remove(bottom)
+
+    assert sweep_line.above(top) is sweep_line.below(top) is None
+
+
+def test_find_equal(context: Context) -> None:
+    sweep_line = SweepLine(context)
+    event = LeftEvent.from_segment(Segment(Point(0, 0), Point(2, 2)), 0)
+    equal_event = LeftEvent.from_segment(Segment(Point(2, 2), Point(0, 0)), 1)
+    other_event = LeftEvent.from_segment(Segment(Point(0, 0), Point(2, 0)), 2)
+
+    assert sweep_line.find_equal(equal_event) is None
+
+    sweep_line.add(event)
+
+    assert sweep_line.find_equal(equal_event) is event
+    assert sweep_line.find_equal(other_event) is None
+
+    sweep_line.remove(event)
+
+    assert sweep_line.find_equal(equal_event) is None
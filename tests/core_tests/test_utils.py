@@ -0,0 +1,48 @@
+from typing import Tuple
+
+import pytest
+from ground.base import (Context,
+                         Relation)
+from hypothesis import given
+
+from bentley_ottmann.core.utils import boxes_overlap
+from tests.utils import (Point,
+                         Segment)
+from . import strategies
+
+
+@pytest.mark.parametrize('first_start,first_end,second_start,second_end,'
+                         'expected',
+                         [((0, 0), (1, 1), (1, 1), (2, 3), True),
+                          ((0, 0), (1, 1), (1, 0), (2, 1), True),
+                          ((0, 0), (1, 1), (2, 0), (3, 1), False),
+                          ((0, 0), (1, 1), (0, 2), (1, 3), False),
+                          ((0, 2), (2, 0), (1, 1), (3, 3), True),
+                          ((0, 0), (0, 2), (0, 1), (0, 3), True),
+                          ((0, 0), (0, 1), (0, 2), (0, 3), False),
+                          ((0, 0), (0, 1), (1, 0), (1, 1), False),
+                          ((0, 0), (2, 0), (1, 0), (3, 0), True),
+                          ((0, 0), (1, 0), (0, 1), (1, 1), False),
+                          ((0, 0), (2, 0), (1, -1), (1, 1), True)])
+def test_boxes_overlap_examples(first_start: Tuple[int, int],
+                                first_end: Tuple[int, int],
+                                second_start: Tuple[int, int],
+                                second_end: Tuple[int, int],
+                                expected: bool) -> None:
+    assert boxes_overlap(Point(*first_start), Point(*first_end),
+                         Point(*second_start), Point(*second_end)) is expected
+    assert boxes_overlap(Point(*second_start), Point(*second_end),
+                         Point(*first_start), Point(*first_end)) is expected
+
+
+@given(strategies.segments_pairs)
+def test_boxes_overlap_of_related_segments(
+        context: Context, segments_pair: Tuple[Segment, Segment]
+) -> None:
+    first, second = segments_pair
+
+    result = boxes_overlap(*sorted([first.start, first.end]),
+                           *sorted([second.start, second.end]))
+
+    assert (result
+            or context.segments_relation(first, second) is Relation.DISJOINT)
@@ -2,7 +2,8 @@ from functools import partial
 from itertools import (combinations,
                        repeat,
                        starmap)
-from typing import List
+from typing import (List,
+                    Tuple)
 
 from hypothesis import strategies
 
@@ -27,6 +28,15 @@ triangular_contours = (points_strategies
                                         min_size=3,
                                         max_size=3))
                        .map(Contour))
+
+
+def to_contours_with_offsets(contour: Contour
+                             ) -> Strategy[Tuple[Contour, int]]:
+    return strategies.tuples(strategies.just(contour),
+                             strategies.integers(0, len(contour.vertices) - 1))
+
+
+contours_with_offsets = contours.flatmap(to_contours_with_offsets)
 degenerate_contours = (points_strategies
                        .flatmap(partial(strategies.lists,
                                         max_size=2))
@@ -57,6 +67,18 @@ def to_overlapped_segments(segments: List[Segment],
 
 segments_lists |= strategies.builds(to_overlapped_segments, segments_lists,
                                     strategies.integers(1, 100))
+
+
+def to_segments_lists_with_permutations(
+        segments: List[Segment]
+) -> Strategy[Tuple[List[Segment], List[Segment]]]:
+    return strategies.tuples(strategies.just(segments),
+                             strategies.permutations(segments))
+
+
+segments_lists_with_permutations = segments_lists.flatmap(
+        to_segments_lists_with_permutations
+)
 empty_segments_lists = strategies.builds(list)
 non_empty_segments_lists = ((segments_strategies
                              .flatmap(partial(strategies.lists,
@@ -1,5 +1,6 @@
 from itertools import (chain,
                        combinations)
+from typing import Tuple
 
 import pytest
 from ground.base import (Context,
@@ -11,7 +12,8 @@ from bentley_ottmann.planar import contour_self_intersects
 from tests.utils import (contour_to_edges,
                          pop_left_vertex,
                          reverse_contour,
-                         reverse_contour_coordinates)
+                         reverse_contour_coordinates,
+                         rotate_contour)
 from . import strategies
 
 
@@ -88,6 +90,15 @@ def test_reversed_coordinates(contour: Contour) -> None:
     assert result is contour_self_intersects(reverse_contour_coordinates(contour))
 
 
+@given(strategies.contours_with_offsets)
+def test_rotated(contour_with_offset: Tuple[Contour, int]) -> None:
+    contour, offset = contour_with_offset
+
+    result = contour_self_intersects(contour)
+
+    assert result is contour_self_intersects(rotate_contour(contour, offset))
+
+
 @given(strategies.degenerate_contours)
 def test_degenerate_contour(contour: Contour) -> None:
     with pytest.raises(ValueError):
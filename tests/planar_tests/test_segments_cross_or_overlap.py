@@ -1,4 +1,5 @@
-from typing import List
+from typing import (List,
+                    Tuple)
 
 import pytest
 from ground.base import (Context,
@@ -48,6 +49,16 @@ def test_reversed(segments: List[Segment]) -> None:
     assert result is segments_cross_or_overlap(segments[::-1])
 
 
+@given(strategies.segments_lists_with_permutations)
+def test_permuted(segments_with_permutation: Tuple[List[Segment],
+                                                   List[Segment]]) -> None:
+    segments, permuted_segments = segments_with_permutation
+
+    result = segments_cross_or_overlap(segments)
+
+    assert result is segments_cross_or_overlap(permuted_segments)
+
+
 @given(strategies.segments_lists)
 def test_reversed_endpoints(segments: List[Segment]) -> None:
     result = segments_cross_or_overlap(segments)
@@ -89,6 +89,11 @@ def reverse_point_coordinates(point: Point) -> Point:
     return Point(point.y, point.x)
 
 
+def rotate_contour(contour: Contour, offset: int) -> Contour:
+    vertices = contour.vertices
+    return Contour(vertices[offset:] + vertices[:offset])
+
+
 def scale_segment(segment: Segment,
                   *,
                   scale: Scalar) -> Segment: